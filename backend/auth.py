@@ -1,14 +1,20 @@
 """JWT authentication and authorization."""
 
-import os
-from typing import Optional
-import json
 import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Union
 
 import jwt
+import orjson
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt import PyJWK
 
 # Load environment variables
 load_dotenv()
@@ -24,9 +30,142 @@ if not JWT_SECRET and not TEST_MODE:
         "Must match BETTER_AUTH_SECRET from frontend."
     )
 
+# Verification key, allowed algorithms and decode options, built once at
+# import so no per-request work is spent re-encoding or re-preparing them
+JWT_ALGORITHMS = frozenset([JWT_ALGORITHM])
+JWT_REQUIRED_CLAIMS = ("sub", "exp")
+_JWT_SECRET_BYTES = JWT_SECRET.encode("utf-8") if JWT_SECRET else b""
+# An "oct" JWK is only valid for HMAC algorithms; for anything else the raw
+# secret is passed through and PyJWT rejects tokens per request as before
+_JWT_KEY: Union[PyJWK, str, None] = JWT_SECRET
+if JWT_SECRET and JWT_ALGORITHM.startswith("HS"):
+    _JWT_KEY = PyJWK.from_dict(
+        {
+            "kty": "oct",
+            "k": base64.urlsafe_b64encode(_JWT_SECRET_BYTES).rstrip(b"=").decode(),
+        },
+        algorithm=JWT_ALGORITHM,
+    )
+
+# No audience or issuer is configured, so those checks are skipped
+_JWT_DECODE_OPTIONS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "require": list(JWT_REQUIRED_CLAIMS),
+}
+
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Cache of successfully verified tokens: sha256(token) -> (monotonic expiry, user_id).
+# Clients reuse the same bearer token across many requests, so a hit skips
+# base64 decoding and signature verification entirely.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 300.0
+
+_token_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_user_id(key: bytes) -> Optional[str]:
+    """Return the cached user_id for a token hash, or None if missing/expired."""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+
+        expiry, user_id = entry
+        if time.monotonic() >= expiry:
+            del _token_cache[key]
+            return None
+
+        _token_cache.move_to_end(key)
+        return user_id
+
+
+def _cache_user_id(key: bytes, user_id: str, payload: dict) -> None:
+    """Cache a verified token until the TTL or the token's own exp, whichever is first."""
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+
+    with _token_cache_lock:
+        _token_cache[key] = (time.monotonic() + ttl, user_id)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode a base64url JWT segment, restoring the stripped padding."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _verify_hs256(token: str) -> dict:
+    """Verify an HS256 JWT and return its payload.
+
+    A minimal replacement for jwt.decode on the hot path: one rsplit, one
+    HMAC-SHA256 and an orjson parse, plus the required-claim, sub type and
+    exp/iat/nbf checks PyJWT would do with the same options.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, has a bad
+            signature, uses another algorithm, has invalid claims, or has
+            expired
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.rsplit(".", 2)
+    except ValueError:
+        raise jwt.DecodeError("Not enough segments") from None
+    if "." in header_b64:
+        raise jwt.DecodeError("Too many segments")
+
+    header = orjson.loads(_b64url_decode(header_b64))
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    signing_input = token[: len(header_b64) + 1 + len(payload_b64)].encode()
+    expected = hmac.new(_JWT_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    payload = orjson.loads(_b64url_decode(payload_b64))
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    for claim in JWT_REQUIRED_CLAIMS:
+        if payload.get(claim) is None:
+            raise jwt.MissingRequiredClaimError(claim)
+
+    if not isinstance(payload["sub"], str):
+        raise jwt.exceptions.InvalidSubjectError("Subject must be a string")
+
+    now = time.time()
+    exp = payload["exp"]
+    if not isinstance(exp, (int, float)):
+        raise jwt.DecodeError("Expiration Time claim (exp) must be a number.")
+    if exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    if "iat" in payload:
+        iat = payload["iat"]
+        if not isinstance(iat, (int, float)):
+            raise jwt.InvalidIssuedAtError("Issued At claim (iat) must be an integer.")
+        if iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+
+    nbf = payload.get("nbf")
+    if nbf is not None:
+        if not isinstance(nbf, (int, float)):
+            raise jwt.DecodeError("Not Before claim (nbf) must be a number.")
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    return payload
+
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     """Verify JWT token and extract user_id.
@@ -36,6 +175,10 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
 
     In TEST_MODE, the token signature is not verified (for demo purposes).
 
+    Successful verifications are cached in-process (keyed by the token's
+    SHA-256 hash) for up to TOKEN_CACHE_TTL_SECONDS, never past the token's
+    exp claim. Failures are never cached.
+
     Args:
         credentials: HTTP Bearer token from Authorization header
 
@@ -46,30 +189,41 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         HTTPException: 401 if token is missing, invalid, or expired
     """
     token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode()).digest()
+
+    cached_user_id = _get_cached_user_id(cache_key)
+    if cached_user_id is not None:
+        return cached_user_id
 
     try:
         if TEST_MODE:
             # In test mode, decode without verification (for demo)
             # Extract payload from JWT (format: header.payload.signature)
-            parts = token.split('.')
-            if len(parts) != 3:
+            # A single bounded split; the signature must not contain another '.'
+            try:
+                _, payload_b64, signature_b64 = token.split('.', 2)
+                if "." in signature_b64:
+                    raise ValueError("Too many segments")
+            except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid token format",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-            # Decode payload (add padding if needed)
-            payload_b64 = parts[1]
-            padding = 4 - (len(payload_b64) % 4)
-            if padding != 4:
-                payload_b64 += '=' * padding
-
-            payload_json = base64.b64decode(payload_b64).decode('utf-8')
-            payload = json.loads(payload_json)
+            # Decode payload (JWT segments are unpadded base64url)
+            payload = orjson.loads(_b64url_decode(payload_b64))
+        elif JWT_ALGORITHM == "HS256":
+            # Production mode: verify signature (HS256 fast path)
+            payload = _verify_hs256(token)
         else:
-            # Production mode: verify signature
-            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            # Production mode: verify signature with PyJWT for other algorithms
+            payload = jwt.decode(
+                token,
+                _JWT_KEY,
+                algorithms=JWT_ALGORITHMS,
+                options=_JWT_DECODE_OPTIONS,
+            )
 
         # Extract user_id from 'sub' claim
         user_id: Optional[str] = payload.get("sub")
@@ -81,6 +235,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        _cache_user_id(cache_key, user_id, payload)
         return user_id
 
     except jwt.ExpiredSignatureError:
@@ -89,7 +244,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except (jwt.InvalidTokenError, json.JSONDecodeError, ValueError):
+    except (jwt.InvalidTokenError, orjson.JSONDecodeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -97,20 +252,30 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         )
 
 
-def verify_user_access(user_id: str, authenticated_user_id: str) -> None:
+async def require_matching_user(user_id: str, auth_user_id: str = Depends(verify_token)) -> str:
     """Verify that the user_id in the URL matches the authenticated user.
 
-    This prevents users from accessing other users' resources.
+    Combines JWT verification with the ownership check so task routes need
+    a single dependency. FastAPI caches verify_token per request, so the
+    token is still only verified once, and this check is async so it runs
+    inline on the event loop rather than in the threadpool. This prevents
+    users from accessing other users' resources.
 
     Args:
         user_id: The user_id from the URL path parameter
-        authenticated_user_id: The user_id extracted from the JWT token
+        auth_user_id: The user_id extracted from the JWT token
+
+    Returns:
+        str: The authenticated user's ID
 
     Raises:
-        HTTPException: 403 if user_id doesn't match authenticated_user_id
+        HTTPException: 401 if the token is invalid (from verify_token)
+        HTTPException: 403 if user_id doesn't match the authenticated user
     """
-    if user_id != authenticated_user_id:
+    if user_id != auth_user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot access another user's resources",
         )
+
+    return auth_user_id
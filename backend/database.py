@@ -1,10 +1,13 @@
 """Database connection and session management."""
 
 import os
-from typing import Generator
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Load environment variables
 load_dotenv()
@@ -18,36 +21,68 @@ if not DATABASE_URL:
         "Set it in .env file or environment."
     )
 
-# Create engine with connection pooling (optimized for Neon serverless)
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=2,  # Keep low for serverless databases
-    max_overflow=5,  # Limited overflow for serverless
+
+def _async_database_url(database_url: str) -> URL:
+    """Convert a plain PostgreSQL URL to its asyncpg equivalent.
+
+    DATABASE_URL is shared with Alembic (which uses psycopg2), so it is kept
+    in the usual postgresql:// form and rewritten here. asyncpg takes 'ssl'
+    instead of libpq's 'sslmode' query parameter.
+    """
+    url = make_url(database_url)
+
+    if url.drivername in ("postgres", "postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        url = url.update_query_dict({"ssl": url.query["sslmode"]}).difference_update_query(
+            ["sslmode"]
+        )
+
+    return url
+
+
+# Connection pool sizing (per worker process)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# Create async engine with connection pooling (optimized for Neon serverless)
+engine = create_async_engine(
+    _async_database_url(DATABASE_URL),
+    pool_size=DB_POOL_SIZE,  # Persistent connections kept in the pool
+    max_overflow=DB_MAX_OVERFLOW,  # Extra connections allowed under burst load
+    pool_use_lifo=True,  # Reuse the most recent connection so idle ones can be recycled
     pool_pre_ping=True,  # Verify connections before using them
     pool_recycle=300,  # Recycle connections every 5 minutes
-    connect_args={"connect_timeout": 10},  # 10 second timeout
+    connect_args={"timeout": 10},  # 10 second timeout
     echo=False,  # Set to True for SQL query logging (useful for debugging)
 )
 
 
-def create_db_and_tables() -> None:
+async def create_db_and_tables() -> None:
     """Create all database tables.
 
     This creates tables defined in models.py using SQLModel metadata.
     Note: Better Auth tables (users, accounts, sessions, etc.) are created
     by Better Auth on the frontend, not here.
     """
-    SQLModel.metadata.create_all(engine)
+    import models  # noqa: F401  (registers tables on SQLModel.metadata)
 
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
-def get_session() -> Generator[Session, None, None]:
+
+async def get_session() -> AsyncIterator[AsyncSession]:
     """Dependency for database sessions.
 
-    Yields a SQLModel session that automatically closes after use.
+    Yields an async SQLModel session that automatically closes after use.
     Use this as a FastAPI dependency with Depends(get_session).
 
+    Objects are not expired on commit, so returned models can be serialized
+    without triggering a lazy (blocking) reload.
+
     Yields:
-        Session: SQLModel database session
+        AsyncSession: Async SQLModel database session
     """
-    with Session(engine) as session:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
@@ -0,0 +1,64 @@
+"""Initial schema: users and tasks tables
+
+Revision ID: 000
+Revises:
+Create Date: 2026-10-14
+
+Creates the tables as SQLModel.metadata.create_all() originally did, so
+`alembic upgrade head` can build the schema on an empty database. Tables
+that already exist (created by create_all() or, for users, by Better Auth)
+are left untouched so existing databases can be stamped forward.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "000"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Offline (--sql) mode has no connection to inspect; emit everything
+    existing: set[str] = set()
+    if not context.is_offline_mode():
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("email_verified", sa.Boolean(), nullable=False),
+            sa.Column("name", sa.String(), nullable=True),
+            sa.Column("image", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if "tasks" not in existing:
+        op.create_table(
+            "tasks",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("completed", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_tasks_user_id", "tasks", ["user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("tasks")
+    op.drop_table("users")
@@ -0,0 +1,45 @@
+"""Add composite task indexes matching the list endpoint access patterns
+
+Revision ID: 001
+Revises: 000
+Create Date: 2026-10-14
+
+Replaces the single-column user_id index with composite indexes that
+lead with user_id and end with the id tie-breaker used by every ORDER BY
+and the keyset cursor.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "001"
+down_revision: Union[str, Sequence[str], None] = "000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tasks_user_created", "tasks", ["user_id", "created_at", "id"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_tasks_user_completed_created",
+        "tasks",
+        ["user_id", "completed", "created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tasks_user_updated", "tasks", ["user_id", "updated_at", "id"], if_not_exists=True
+    )
+    # Covered by the composite indexes above (user_id is the leading column)
+    op.drop_index("ix_tasks_user_id", table_name="tasks", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_tasks_user_id", "tasks", ["user_id"], if_not_exists=True)
+    op.drop_index("ix_tasks_user_updated", table_name="tasks", if_exists=True)
+    op.drop_index("ix_tasks_user_completed_created", table_name="tasks", if_exists=True)
+    op.drop_index("ix_tasks_user_created", table_name="tasks", if_exists=True)
@@ -0,0 +1,37 @@
+"""Default task timestamps to the current UTC time on the database side
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14
+
+Task.created_at/updated_at are no longer filled in by Python, so inserts
+that omit them rely on these server defaults. The default is UTC (not the
+session's local time) to match existing rows written with datetime.utcnow().
+updated_at is refreshed by the ORM's onupdate, which needs no schema change.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Inlined rather than imported from models.UtcNow so this revision keeps
+# working if the application code changes
+UTC_NOW = "timezone('UTC', now())"
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, Sequence[str], None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column("tasks", "created_at", server_default=sa.text(UTC_NOW))
+    op.alter_column("tasks", "updated_at", server_default=sa.text(UTC_NOW))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("tasks", "updated_at", server_default=None)
+    op.alter_column("tasks", "created_at", server_default=None)
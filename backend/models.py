@@ -3,7 +3,33 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlmodel import Field, Index, SQLModel
+
+
+class UtcNow(FunctionElement):
+    """SQL expression for the current time as a naive UTC timestamp.
+
+    Timestamp columns are TIMESTAMP WITHOUT TIME ZONE and hold naive UTC
+    values (as written by datetime.utcnow()), so database defaults must not
+    depend on the session's TimeZone setting.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow, "postgresql")
+def _compile_utcnow_postgresql(element: UtcNow, compiler: object, **kw: object) -> str:
+    return "timezone('UTC', now())"
+
+
+@compiles(UtcNow)
+def _compile_utcnow_default(element: UtcNow, compiler: object, **kw: object) -> str:
+    # CURRENT_TIMESTAMP is UTC on SQLite (used for local experiments)
+    return "CURRENT_TIMESTAMP"
 
 
 class User(SQLModel, table=True):
@@ -32,17 +58,37 @@ class Task(SQLModel, table=True):
     - description: Optional, max 1000 characters
     - completed: Boolean status, defaults to False
     - Timestamps for creation and updates
+
+    Composite indexes lead with user_id and match the filter + sort
+    combinations used by the task list endpoint, ending in the id
+    tie-breaker, so a page of tasks can be read straight off the index
+    without a per-user sort.
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_user_created", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_completed_created", "user_id", "completed", "created_at", "id"),
+        Index("ix_tasks_user_updated", "user_id", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: str = Field(foreign_key="users.id", index=True)
+    user_id: str = Field(foreign_key="users.id")
     title: str = Field(max_length=200)
     description: Optional[str] = Field(default=None)
     completed: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Timestamps are set by the database in UTC on insert, and updated_at is
+    # also refreshed by every UPDATE statement (including bulk updates)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": UtcNow()},
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": UtcNow(), "onupdate": UtcNow()},
+    )
 
     def __repr__(self) -> str:
         status = "✓" if self.completed else "○"
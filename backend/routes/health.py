@@ -1,26 +1,44 @@
 """Health check endpoint."""
 
+import time
 from datetime import datetime
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from schemas import HealthResponse
 
 router = APIRouter()
 
+# Health probes hit this endpoint many times per second, so the serialized
+# body is cached and rebuilt at most once per HEALTH_CACHE_SECONDS
+HEALTH_CACHE_SECONDS = 1.0
+
+_cached_health: dict = {"body": b"", "expires": 0.0}
+
 
 @router.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint.
 
     Returns the current status of the API service.
     No authentication required.
 
+    The pre-serialized JSON body is returned directly (bypassing response
+    model validation), so the timestamp may lag by up to one second.
+
     Returns:
         HealthResponse: Service status, timestamp, and version
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        version="2.0",
-    )
+    now = time.monotonic()
+    if now >= _cached_health["expires"]:
+        _cached_health["body"] = orjson.dumps(
+            {
+                "status": "healthy",
+                "timestamp": datetime.utcnow().isoformat(),
+                "version": "2.0",
+            }
+        )
+        _cached_health["expires"] = now + HEALTH_CACHE_SECONDS
+
+    return Response(content=_cached_health["body"], media_type="application/json")
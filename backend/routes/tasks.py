@@ -1,12 +1,15 @@
 """Task CRUD API endpoints."""
 
-from datetime import datetime
-from typing import Literal
+from datetime import datetime, timezone
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, tuple_, update
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from auth import verify_token, verify_user_access
+from auth import require_matching_user
 from database import get_session
 from models import Task
 from schemas import TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
@@ -14,6 +17,26 @@ from schemas import TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
 router = APIRouter()
 
 
+def _make_etag(updated_at: Optional[datetime], *parts: object) -> str:
+    """Build a weak ETag from a last-modified timestamp and extra version parts."""
+    if updated_at is None:
+        stamp = 0
+    else:
+        # updated_at is naive UTC; without a tzinfo, timestamp() would use the host's local time
+        stamp = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+    return 'W/"' + "-".join(str(part) for part in (stamp, *parts)) + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.post(
     "/{user_id}/tasks",
     response_model=TaskResponse,
@@ -23,15 +46,14 @@ router = APIRouter()
 async def create_task(
     user_id: str,
     task_data: TaskCreate,
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
 ) -> Task:
     """Create a new task for the authenticated user.
 
     Args:
         user_id: User ID from URL (must match authenticated user)
         task_data: Task creation data (title and optional description)
-        authenticated_user_id: User ID from JWT token
         session: Database session
 
     Returns:
@@ -41,9 +63,6 @@ async def create_task(
         HTTPException: 403 if user_id doesn't match authenticated user
         HTTPException: 400 if validation fails
     """
-    # Verify user can only create tasks for themselves
-    verify_user_access(user_id, authenticated_user_id)
-
     # Create new task
     task = Task(
         user_id=user_id,
@@ -52,8 +71,8 @@ async def create_task(
     )
 
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
+    await session.refresh(task)
 
     return task
 
@@ -61,34 +80,70 @@ async def create_task(
 @router.get("/{user_id}/tasks", response_model=TaskListResponse, tags=["tasks"])
 async def get_tasks(
     user_id: str,
+    request: Request,
     status_filter: Literal["all", "pending", "completed"] = Query("all", alias="status"),
     sort: Literal["created", "updated", "title"] = Query("created"),
     order: Literal["asc", "desc"] = Query("desc"),
     limit: int = Query(100, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
-) -> TaskListResponse:
+    after_created: Optional[datetime] = Query(None),
+    after_id: Optional[int] = Query(None),
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
     """Get all tasks for the authenticated user with filtering and sorting.
 
+    The response carries a weak ETag derived from the user's task count and
+    latest updated_at; a matching If-None-Match returns 304 without running
+    the page query.
+
     Args:
         user_id: User ID from URL (must match authenticated user)
         status_filter: Filter by status (all/pending/completed)
         sort: Sort field (created/updated/title)
         order: Sort order (asc/desc)
         limit: Maximum number of tasks to return (1-100)
-        offset: Number of tasks to skip for pagination
-        authenticated_user_id: User ID from JWT token
+        offset: Number of tasks to skip for pagination (ignored with a cursor)
+        after_created: Keyset cursor - created_at of the last task seen
+        after_id: Keyset cursor - id of the last task seen
+        request: Incoming request (for If-None-Match)
         session: Database session
 
     Returns:
-        TaskListResponse: List of tasks with statistics
+        TaskListResponse: List of tasks with statistics and the next page cursor,
+        or an empty 304 response if the client's copy is current
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if the cursor is incomplete or used with a non-created sort
     """
-    # Verify user can only access their own tasks
-    verify_user_access(user_id, authenticated_user_id)
+    # Validate keyset cursor
+    use_cursor = after_created is not None or after_id is not None
+    if use_cursor and (after_created is None or after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_created and after_id must be provided together",
+        )
+    if use_cursor and sort != "created":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is only supported with sort=created",
+        )
+
+    # Calculate statistics (across all tasks, not just paginated) in a single
+    # aggregate query instead of loading every task into Python. The latest
+    # updated_at plus the count also versions the list for the ETag.
+    stats_query = select(
+        func.count(),
+        func.count().filter(Task.completed == False),  # noqa: E712
+        func.count().filter(Task.completed == True),  # noqa: E712
+        func.max(Task.updated_at),
+    ).where(Task.user_id == user_id)
+    total, pending, completed, last_updated = (await session.exec(stats_query)).one()
+
+    etag = _make_etag(last_updated, total, completed)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
     # Build base query
     query = select(Task).where(Task.user_id == user_id)
@@ -104,55 +159,79 @@ async def get_tasks(
         sort
     ]
 
+    # Task.id breaks ties so keyset pagination never skips or repeats rows
     if order == "asc":
-        query = query.order_by(sort_field.asc())
+        query = query.order_by(sort_field.asc(), Task.id.asc())
     else:
-        query = query.order_by(sort_field.desc())
+        query = query.order_by(sort_field.desc(), Task.id.desc())
+
+    # Apply pagination (keyset seek when a cursor is given, offset otherwise)
+    if use_cursor:
+        # created_at is stored as naive UTC; clients usually send an aware
+        # ISO timestamp (e.g. Date.toISOString()), which asyncpg can't bind
+        if after_created.tzinfo is not None:
+            after_created = after_created.astimezone(timezone.utc).replace(tzinfo=None)
+        position = tuple_(Task.created_at, Task.id)
+        cursor = tuple_(after_created, after_id)
+        query = query.where(position > cursor if order == "asc" else position < cursor)
+    else:
+        query = query.offset(offset)
 
-    # Apply pagination
-    query = query.offset(offset).limit(limit)
+    query = query.limit(limit)
 
     # Execute query
-    tasks = list(session.exec(query).all())
-
-    # Calculate statistics (across all tasks, not just paginated)
-    all_tasks_query = select(Task).where(Task.user_id == user_id)
-    all_tasks = list(session.exec(all_tasks_query).all())
-
-    total = len(all_tasks)
-    pending = sum(1 for t in all_tasks if not t.completed)
-    completed = sum(1 for t in all_tasks if t.completed)
-
-    return TaskListResponse(tasks=tasks, total=total, pending=pending, completed=completed)
+    tasks = list((await session.exec(query)).all())
+
+    # A full page means there may be more tasks after the last one returned
+    next_cursor = None
+    if sort == "created" and len(tasks) == limit:
+        next_cursor = {"created_at": tasks[-1].created_at, "id": tasks[-1].id}
+
+    # Serialize straight to orjson: the tasks come from the database and
+    # already match TaskResponse, so per-task response model validation is skipped
+    return ORJSONResponse(
+        {
+            "tasks": [task.model_dump() for task in tasks],
+            "total": total,
+            "pending": pending,
+            "completed": completed,
+            "next_cursor": next_cursor,
+        },
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/{user_id}/tasks/{task_id}", response_model=TaskResponse, tags=["tasks"])
 async def get_task(
     user_id: str,
     task_id: int,
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
-) -> Task:
+    request: Request,
+    response: Response,
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
+) -> Union[Task, Response]:
     """Get a specific task by ID.
 
+    The response carries a weak ETag derived from the task's updated_at;
+    a matching If-None-Match returns 304 with no body.
+
     Args:
         user_id: User ID from URL (must match authenticated user)
         task_id: Task ID to retrieve
-        authenticated_user_id: User ID from JWT token
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         session: Database session
 
     Returns:
-        TaskResponse: The requested task
+        TaskResponse: The requested task, or an empty 304 response if the
+        client's copy is current
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
         HTTPException: 404 if task not found or belongs to different user
     """
-    # Verify user can only access their own tasks
-    verify_user_access(user_id, authenticated_user_id)
-
     # Get task
-    task = session.get(Task, task_id)
+    task = await session.get(Task, task_id)
 
     if not task or task.user_id != user_id:
         raise HTTPException(
@@ -160,6 +239,11 @@ async def get_task(
             detail="Task not found",
         )
 
+    etag = _make_etag(task.updated_at, task.id)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return task
 
 
@@ -168,8 +252,8 @@ async def update_task(
     user_id: str,
     task_id: int,
     task_data: TaskUpdate,
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
 ) -> Task:
     """Update a task's title and/or description.
 
@@ -177,7 +261,6 @@ async def update_task(
         user_id: User ID from URL (must match authenticated user)
         task_id: Task ID to update
         task_data: Updated task data (title and description)
-        authenticated_user_id: User ID from JWT token
         session: Database session
 
     Returns:
@@ -188,26 +271,23 @@ async def update_task(
         HTTPException: 404 if task not found
         HTTPException: 400 if validation fails
     """
-    # Verify user can only update their own tasks
-    verify_user_access(user_id, authenticated_user_id)
-
-    # Get task
-    task = session.get(Task, task_id)
+    # Update task and fetch the new row in one round trip (UPDATE ... RETURNING);
+    # the user_id predicate keeps the ownership check atomic with the write
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(title=task_data.title, description=task_data.description)
+        .returning(Task)
+    )
+    task = (await session.exec(statement)).scalar_one_or_none()
 
-    if not task or task.user_id != user_id:
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    # Update task
-    task.title = task_data.title
-    task.description = task_data.description
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
 
     return task
 
@@ -216,15 +296,14 @@ async def update_task(
 async def toggle_task_complete(
     user_id: str,
     task_id: int,
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
 ) -> Task:
     """Toggle task completion status.
 
     Args:
         user_id: User ID from URL (must match authenticated user)
         task_id: Task ID to toggle
-        authenticated_user_id: User ID from JWT token
         session: Database session
 
     Returns:
@@ -234,25 +313,22 @@ async def toggle_task_complete(
         HTTPException: 403 if user_id doesn't match authenticated user
         HTTPException: 404 if task not found
     """
-    # Verify user can only modify their own tasks
-    verify_user_access(user_id, authenticated_user_id)
-
-    # Get task
-    task = session.get(Task, task_id)
+    # Toggle completion status in the database (UPDATE ... RETURNING)
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(completed=~Task.completed)
+        .returning(Task)
+    )
+    task = (await session.exec(statement)).scalar_one_or_none()
 
-    if not task or task.user_id != user_id:
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    # Toggle completion status
-    task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
 
     return task
 
@@ -263,33 +339,30 @@ async def toggle_task_complete(
 async def delete_task(
     user_id: str,
     task_id: int,
-    authenticated_user_id: str = Depends(verify_token),
-    session: Session = Depends(get_session),
+    _: str = Depends(require_matching_user),
+    session: AsyncSession = Depends(get_session),
 ) -> None:
     """Delete a task permanently.
 
     Args:
         user_id: User ID from URL (must match authenticated user)
         task_id: Task ID to delete
-        authenticated_user_id: User ID from JWT token
         session: Database session
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
         HTTPException: 404 if task not found
     """
-    # Verify user can only delete their own tasks
-    verify_user_access(user_id, authenticated_user_id)
-
-    # Get task
-    task = session.get(Task, task_id)
+    # Delete task (DELETE ... RETURNING tells us whether a row matched)
+    statement = (
+        delete(Task).where(Task.id == task_id, Task.user_id == user_id).returning(Task.id)
+    )
+    deleted_id = (await session.exec(statement)).scalar_one_or_none()
 
-    if not task or task.user_id != user_id:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    # Delete task
-    session.delete(task)
-    session.commit()
+    await session.commit()
@@ -52,6 +52,16 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+class TaskCursor(BaseModel):
+    """Keyset pagination cursor pointing at the last task of a page.
+
+    Pass the values back as after_created/after_id to fetch the next page.
+    """
+
+    created_at: datetime
+    id: int
+
+
 class TaskListResponse(BaseModel):
     """Schema for list of tasks with statistics.
 
@@ -62,6 +72,9 @@ class TaskListResponse(BaseModel):
     total: int = Field(description="Total number of tasks")
     pending: int = Field(description="Number of incomplete tasks")
     completed: int = Field(description="Number of completed tasks")
+    next_cursor: Optional[TaskCursor] = Field(
+        default=None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class ErrorResponse(BaseModel):
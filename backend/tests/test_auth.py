@@ -0,0 +1,195 @@
+"""Tests for JWT verification in auth.py."""
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+
+import jwt
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+import auth
+
+SECRET = os.environ["JWT_SECRET"]
+
+
+def make_token(payload: dict, key: str = SECRET, algorithm: str = "HS256") -> str:
+    return jwt.encode(payload, key, algorithm=algorithm)
+
+
+def valid_payload(**claims: object) -> dict:
+    return {"sub": "user-123", "exp": int(time.time()) + 600, **claims}
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def sign_raw(header: bytes, payload: bytes) -> str:
+    """Build a correctly signed HS256 token from raw header/payload bytes."""
+    signing_input = f"{b64url(header)}.{b64url(payload)}"
+    signature = hmac.new(SECRET.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{b64url(signature)}"
+
+
+def credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+def test_valid_token_returns_payload():
+    payload = valid_payload()
+    assert auth._verify_hs256(make_token(payload)) == payload
+
+
+def test_valid_token_matches_pyjwt():
+    token = make_token(valid_payload(aud="frontend", iat=int(time.time())))
+    expected = jwt.decode(token, SECRET, algorithms=["HS256"], options={"verify_aud": False})
+    assert auth._verify_hs256(token) == expected
+
+
+@pytest.mark.parametrize(
+    ("claims", "error"),
+    [
+        ({"iat": int(time.time()) + 600}, jwt.ImmatureSignatureError),
+        ({"iat": "not-a-number"}, jwt.InvalidIssuedAtError),
+        ({"sub": 123}, jwt.exceptions.InvalidSubjectError),
+    ],
+)
+def test_invalid_claims_are_rejected_like_pyjwt(claims, error):
+    token = sign_raw(b'{"alg":"HS256","typ":"JWT"}', orjson.dumps(valid_payload(**claims)))
+    with pytest.raises(error):
+        jwt.decode(token, SECRET, algorithms=["HS256"], options={"verify_aud": False})
+    with pytest.raises(error):
+        auth._verify_hs256(token)
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = make_token(valid_payload()).split(".")
+    forged_payload = b64url(b'{"sub":"admin","exp":9999999999}')
+    with pytest.raises(jwt.InvalidSignatureError):
+        auth._verify_hs256(f"{header}.{forged_payload}.{signature}")
+
+
+def test_tampered_signature_is_rejected():
+    header, payload, _ = make_token(valid_payload()).split(".")
+    _, _, other_signature = make_token(valid_payload(), key="x" * 40).split(".")
+    with pytest.raises(jwt.InvalidSignatureError):
+        auth._verify_hs256(f"{header}.{payload}.{other_signature}")
+
+
+@pytest.mark.parametrize("algorithm", ["none", "HS512"])
+def test_other_algorithms_are_rejected(algorithm):
+    key = None if algorithm == "none" else SECRET * 2
+    token = make_token(valid_payload(), key=key, algorithm=algorithm)
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        auth._verify_hs256(token)
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["", "onlyonesegment", "header.payload"],
+)
+def test_too_few_segments_are_rejected(token):
+    with pytest.raises(jwt.DecodeError):
+        auth._verify_hs256(token)
+
+
+def test_too_many_segments_are_rejected():
+    token = make_token(valid_payload())
+    with pytest.raises(jwt.DecodeError):
+        auth._verify_hs256("extra." + token)
+
+
+@pytest.mark.parametrize("payload", [b"[1, 2]", b'"user-123"', b"42"])
+def test_non_object_payload_is_rejected(payload):
+    token = sign_raw(b'{"alg":"HS256","typ":"JWT"}', payload)
+    with pytest.raises(jwt.DecodeError):
+        auth._verify_hs256(token)
+
+
+@pytest.mark.parametrize("claim", ["sub", "exp"])
+def test_missing_required_claim_is_rejected(claim):
+    payload = valid_payload()
+    del payload[claim]
+    with pytest.raises(jwt.MissingRequiredClaimError):
+        auth._verify_hs256(make_token(payload))
+
+
+def test_expired_token_is_rejected():
+    token = make_token(valid_payload(exp=int(time.time()) - 1))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        auth._verify_hs256(token)
+
+
+def test_future_nbf_is_rejected():
+    token = make_token(valid_payload(nbf=int(time.time()) + 600))
+    with pytest.raises(jwt.ImmatureSignatureError):
+        auth._verify_hs256(token)
+
+
+def test_verify_token_returns_sub():
+    assert auth.verify_token(credentials(make_token(valid_payload()))) == "user-123"
+
+
+@pytest.mark.parametrize(
+    ("token", "detail"),
+    [
+        ("not-a-jwt", "Could not validate credentials"),
+        (make_token(valid_payload(), key="x" * 40), "Could not validate credentials"),
+        (make_token(valid_payload(exp=int(time.time()) - 1)), "Token has expired"),
+    ],
+)
+def test_verify_token_rejects_invalid_tokens_with_401(token, detail):
+    with pytest.raises(HTTPException) as exc_info:
+        auth.verify_token(credentials(token))
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == detail
+
+
+def test_verify_token_cache_hit_skips_verification(monkeypatch):
+    token = make_token(valid_payload())
+    assert auth.verify_token(credentials(token)) == "user-123"
+    assert len(auth._token_cache) == 1
+
+    def fail(_token):
+        raise AssertionError("cached token was verified again")
+
+    monkeypatch.setattr(auth, "_verify_hs256", fail)
+    assert auth.verify_token(credentials(token)) == "user-123"
+
+
+def test_verify_token_cache_entry_does_not_outlive_exp():
+    token = make_token(valid_payload(exp=int(time.time()) + 5))
+    auth.verify_token(credentials(token))
+
+    [(expiry, _)] = list(auth._token_cache.values())
+    assert expiry <= time.monotonic() + 5
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        make_token(valid_payload(exp=int(time.time()) - 1)),
+        make_token(valid_payload(), key="x" * 40),
+        make_token({"exp": int(time.time()) + 600}),
+        sign_raw(b'{"alg":"HS256","typ":"JWT"}', orjson.dumps(valid_payload(sub=123))),
+    ],
+)
+def test_verify_token_does_not_cache_failures(token):
+    with pytest.raises(HTTPException) as exc_info:
+        auth.verify_token(credentials(token))
+
+    assert exc_info.value.status_code == 401
+    assert len(auth._token_cache) == 0
@@ -0,0 +1,220 @@
+"""Tests for the task endpoints in routes/tasks.py."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database import get_session
+from main import app
+from models import Task, User
+
+USER_ID = "user-123"
+OTHER_USER_ID = "user-456"
+# Seeded rows are stamped in the past so any write moves updated_at forward
+SEEDED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def auth_headers(user_id: str = USER_ID) -> dict:
+    token = jwt.encode(
+        {"sub": user_id, "exp": int(time.time()) + 600},
+        os.environ["JWT_SECRET"],
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def engine():
+    # One in-memory SQLite database shared by every session in the test
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(engine):
+    async def get_test_session():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def tasks(engine):
+    """Seed five tasks for USER_ID (all created at the same instant) and one for OTHER_USER_ID."""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for user_id in (USER_ID, OTHER_USER_ID):
+            session.add(User(id=user_id, email=f"{user_id}@example.com"))
+        seeded = [
+            Task(
+                user_id=USER_ID,
+                title=f"Task {i}",
+                completed=i % 2 == 0,
+                created_at=SEEDED_AT,
+                updated_at=SEEDED_AT,
+            )
+            for i in range(5)
+        ]
+        seeded.append(
+            Task(
+                user_id=OTHER_USER_ID,
+                title="Someone else's task",
+                created_at=SEEDED_AT,
+                updated_at=SEEDED_AT,
+            )
+        )
+        session.add_all(seeded)
+        await session.commit()
+    return seeded
+
+
+async def test_list_returns_tasks_and_statistics(client, tasks):
+    response = await client.get(f"/api/{USER_ID}/tasks", headers=auth_headers())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [task["title"] for task in body["tasks"]] == [f"Task {i}" for i in reversed(range(5))]
+    assert (body["total"], body["pending"], body["completed"]) == (5, 2, 3)
+    assert body["next_cursor"] is None
+    assert response.headers["ETag"].startswith('W/"')
+
+
+async def test_list_returns_304_for_matching_etag(client, tasks):
+    first = await client.get(f"/api/{USER_ID}/tasks", headers=auth_headers())
+    etag = first.headers["ETag"]
+
+    response = await client.get(
+        f"/api/{USER_ID}/tasks", headers={**auth_headers(), "If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+async def test_list_etag_changes_after_toggle(client, tasks):
+    first = await client.get(f"/api/{USER_ID}/tasks", headers=auth_headers())
+    await client.patch(f"/api/{USER_ID}/tasks/{tasks[0].id}/complete", headers=auth_headers())
+
+    response = await client.get(
+        f"/api/{USER_ID}/tasks", headers={**auth_headers(), "If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+
+
+async def test_task_returns_304_for_matching_etag_until_updated(client, tasks):
+    url = f"/api/{USER_ID}/tasks/{tasks[0].id}"
+    first = await client.get(url, headers=auth_headers())
+    etag = first.headers["ETag"]
+
+    not_modified = await client.get(url, headers={**auth_headers(), "If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    await client.put(url, json={"title": "Renamed"}, headers=auth_headers())
+    changed = await client.get(url, headers={**auth_headers(), "If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Renamed"
+    assert changed.headers["ETag"] != etag
+
+
+async def test_cursor_pages_do_not_repeat_rows(client, tasks):
+    url = f"/api/{USER_ID}/tasks"
+    page_1 = (await client.get(url, params={"limit": 3}, headers=auth_headers())).json()
+    cursor = page_1["next_cursor"]
+    assert cursor == {"created_at": page_1["tasks"][-1]["created_at"], "id": tasks[2].id}
+
+    page_2 = (
+        await client.get(
+            url,
+            params={"limit": 3, "after_created": cursor["created_at"], "after_id": cursor["id"]},
+            headers=auth_headers(),
+        )
+    ).json()
+
+    ids = [task["id"] for task in page_1["tasks"] + page_2["tasks"]]
+    assert ids == [task.id for task in reversed(tasks[:5])]
+    assert page_2["next_cursor"] is None
+
+
+async def test_cursor_binds_timezone_aware_timestamps_as_naive_utc(client, engine, tasks):
+    # asyncpg refuses aware datetimes for TIMESTAMP WITHOUT TIME ZONE columns
+    bound = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record_parameters(conn, cursor, statement, parameters, context, executemany):
+        for params in context.compiled_parameters:
+            bound.extend(value for value in params.values() if isinstance(value, datetime))
+
+    response = await client.get(
+        f"/api/{USER_ID}/tasks",
+        params={"after_created": "2026-01-01T14:00:01+02:00", "after_id": 1},
+        headers=auth_headers(),
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 5
+    assert bound == [SEEDED_AT + timedelta(seconds=1)]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"after_id": 1},
+        {"after_created": SEEDED_AT.isoformat()},
+        {"after_created": SEEDED_AT.isoformat(), "after_id": 1, "sort": "title"},
+    ],
+)
+async def test_incomplete_or_unsupported_cursor_returns_400(client, tasks, params):
+    response = await client.get(f"/api/{USER_ID}/tasks", params=params, headers=auth_headers())
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "json"),
+    [
+        ("PUT", "", {"title": "Renamed"}),
+        ("PATCH", "/complete", None),
+        ("DELETE", "", None),
+    ],
+)
+@pytest.mark.parametrize("task_index", [None, -1], ids=["missing", "other-user"])
+async def test_mutations_return_404_for_missing_or_foreign_task(
+    client, tasks, method, path, json, task_index
+):
+    task_id = 9999 if task_index is None else tasks[task_index].id
+
+    response = await client.request(
+        method, f"/api/{USER_ID}/tasks/{task_id}{path}", json=json, headers=auth_headers()
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Task not found"
+
+    owner = await client.get(f"/api/{OTHER_USER_ID}/tasks", headers=auth_headers(OTHER_USER_ID))
+    assert owner.json()["tasks"][0]["title"] == "Someone else's task"
+
+
+async def test_delete_removes_task(client, tasks):
+    url = f"/api/{USER_ID}/tasks/{tasks[0].id}"
+
+    assert (await client.delete(url, headers=auth_headers())).status_code == 204
+    assert (await client.get(url, headers=auth_headers())).status_code == 404
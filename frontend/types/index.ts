@@ -17,6 +17,12 @@ export interface TaskListResponse {
   total: number
   pending: number
   completed: number
+  next_cursor: TaskCursor | null
+}
+
+export interface TaskCursor {
+  created_at: string
+  id: number
 }
 
 export interface User {